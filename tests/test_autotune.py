@@ -0,0 +1,143 @@
+import time
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, List
+
+import pytest
+
+import typediterable
+from typediterable import core
+
+
+@dataclass
+class User:
+    name: str
+    id: int = 0
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.name, str):
+            raise TypeError(self.name)
+
+
+@dataclass
+class Point:
+    a: Any
+    b: int = 0
+
+
+def _expected(typed_iterable: Any, raw_data: List[Any]) -> List[Any]:
+    errors: List[Any] = []
+    res = list(typed_iterable(raw_data, on_error=lambda d, i, e: errors.append((d, i))))
+    return [res, errors]
+
+
+def _actual(typed_iterable: Any, raw_data: List[Any], **kwargs: Any) -> List[Any]:
+    errors: List[Any] = []
+    it = typed_iterable.autotuned(raw_data, on_error=lambda d, i, e: errors.append((d, i)), **kwargs)
+    return [list(it), errors, it.stats()]
+
+
+@pytest.mark.parametrize(
+    ["typed_iterable", "raw_data"],
+    [
+        [typediterable.AdaptiveTypedIterable[User], [{"name": f"user-{i}", "id": i} for i in range(50)]],
+        [typediterable.AdaptiveTypedIterable[User], [(f"user-{i}", i) for i in range(50)]],
+        [typediterable.AdaptiveTypedIterable[User], ["aa", ("bb", 10), {"id": 20, "name": "cc"}, {"id": 20}] * 5],
+        [typediterable.AdaptiveTypedIterable[Point], [[1, 2, 3]] * 5 + [["x", 7]]],
+        [typediterable.TypedIterable[Point], [[1, 2, 3]] * 5 + [["x", 7]]],
+        [typediterable.TypedIterable[Point], [{"a": 1}, {"b": 2}, 3, {"a": 4, "c": 5}] * 5],
+        [typediterable.TypedIterable[list], [["ab"], ("cd",), "ef"] * 5],
+        [typediterable.TypedIterable[Decimal], ["1", "x", {"value": "3"}, "4"] * 5],
+    ],
+)
+@pytest.mark.parametrize(["sample_size", "chunk_size"], [[1, 1000], [4, 3], [5, 1000]])
+def test_autotuned_same_as_receiver(
+    typed_iterable: Any, raw_data: List[Any], sample_size: int, chunk_size: int
+) -> None:
+    actual, errors, stats = _actual(
+        typed_iterable, raw_data, sample_size=sample_size, resample_every=7, chunk_size=chunk_size
+    )
+    assert [actual, errors] == _expected(typed_iterable, raw_data)
+    assert stats.elements == len(raw_data)
+
+
+def test_autotuned_keeps_receiver_unpacking() -> None:
+    assert list(typediterable.TypedIterable[list].autotuned([["ab"]])) == [["ab"]]
+    expected = [Point(a="x", b=7)]
+    assert list(typediterable.AdaptiveTypedIterable[Point].autotuned([[1, 2, 3]] * 5 + [["x", 7]]))[5:] == expected
+
+
+def test_autotuned_specializes_when_cheaper() -> None:
+    raw_data = [str(i) for i in range(1000)]
+    actual, errors, stats = _actual(typediterable.TypedIterable[Decimal], raw_data, sample_size=200)
+    assert [actual, errors] == _expected(typediterable.TypedIterable[Decimal], raw_data)
+    assert stats.argument_type == core.ArgumentType.ONE_ARGUMENT
+    decision = stats.decisions[0]
+    assert (decision.element_index, decision.argument_type, decision.sample_size) == (
+        0,
+        core.ArgumentType.ONE_ARGUMENT,
+        200,
+    )
+    assert decision.error_rate == 0.0
+    assert decision.latency > 0.0
+    assert 1 <= decision.chunk_size <= 1000
+    assert stats.fallbacks == 0
+
+
+def test_autotuned_keeps_receiver_when_specialization_falls_back() -> None:
+    raw_data = [[1, 2, 3]] * 200
+    actual, errors, stats = _actual(typediterable.AdaptiveTypedIterable[Point], raw_data, sample_size=100)
+    assert [actual, errors] == _expected(typediterable.AdaptiveTypedIterable[Point], raw_data)
+    assert [d.argument_type for d in stats.decisions] == [core.ArgumentType.ADAPTIVE]
+    assert stats.fallbacks == 50
+
+
+def test_autotuned_drift() -> None:
+    typed_iterable = typediterable.AdaptiveTypedIterable[User]
+    raw_data: List[Any] = [{"name": f"user-{i}", "id": i} for i in range(20)]
+    raw_data += [(f"user-{i}", i) for i in range(20)]
+    raw_data += ["user", {"id": 1}, {"name": "user"}]
+    actual, errors, stats = _actual(typed_iterable, raw_data, sample_size=5)
+    assert [actual, errors] == _expected(typed_iterable, raw_data)
+    assert len(errors) == 1
+    assert stats.mismatches == 2
+    assert [d.element_index for d in stats.decisions] == [0, 20, 40]
+
+
+def test_autotuned_resample() -> None:
+    raw_data = [f"user-{i}" for i in range(30)]
+    actual, errors, stats = _actual(typediterable.TypedIterable[User], raw_data, sample_size=5, resample_every=5)
+    assert [actual, errors] == _expected(typediterable.TypedIterable[User], raw_data)
+    assert [d.element_index for d in stats.decisions] == [0, 10, 20]
+
+
+def test_autotuned_raises_without_on_error() -> None:
+    with pytest.raises(TypeError) as e:
+        list(typediterable.AdaptiveTypedIterable[User].autotuned([{"name": "a"}] * 4 + [{"id": 1}], sample_size=2))
+    assert e.value.__context__ is None
+    with pytest.raises(TypeError):
+        list(typediterable.TypedIterable[User].autotuned([{"id": 1}], sample_size=1))
+
+
+def test_autotuned_custom_cast() -> None:
+    class Upper(core.GenericTypedIterable[str]):
+        def _cast(self, d: Any) -> str:
+            return str(d).upper()
+
+    assert list(Upper(str).autotuned(["a", "b", "c"], sample_size=2)) == ["A", "B", "C"]
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"sample_size": 0}, {"resample_every": 0}, {"resample_every": -1}, {"chunk_size": 0}]
+)
+def test_autotuned_rejects_non_positive_arguments(kwargs: Any) -> None:
+    with pytest.raises(ValueError):
+        typediterable.TypedIterable[User].autotuned([], **kwargs)
+
+
+def test_autotuned_latency_excludes_consumer() -> None:
+    it = typediterable.TypedIterable[User].autotuned([{"name": str(i)} for i in range(5)], sample_size=5)
+    for _ in it:
+        time.sleep(0.01)
+    (decision,) = it.stats().decisions
+    assert decision.latency < 0.005
@@ -0,0 +1,166 @@
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import ClassVar
+
+import typediterable
+
+
+@dataclass
+class Item:
+    value: int
+
+
+@dataclass
+class CountedItem:
+    value: str
+    calls: ClassVar[int] = 0
+
+    def __post_init__(self) -> None:
+        CountedItem.calls += 1
+
+
+def test_cached(tmp_path: Path) -> None:
+    path = tmp_path / "data.txt"
+    path.write_text("1\n2\n3\n")
+    cache = typediterable.ResultCache(tmp_path / "cache", chunk_size=2)
+
+    CountedItem.calls = 0
+    expected = [CountedItem("1\n"), CountedItem("2\n"), CountedItem("3\n")]
+    assert list(typediterable.TypedIterable[CountedItem].cached(path, cache)) == expected
+    assert CountedItem.calls == 6
+    assert list(typediterable.TypedIterable[CountedItem].cached(path, cache)) == expected
+    assert CountedItem.calls == 6
+
+    path.write_text("4\n5\n")
+    assert list(typediterable.TypedIterable[CountedItem].cached(path, cache)) == [
+        CountedItem("4\n"),
+        CountedItem("5\n"),
+    ]
+    assert CountedItem.calls == 10
+
+
+def test_cached_with_reader(tmp_path: Path) -> None:
+    path = tmp_path / "data.txt"
+    path.write_text("1,2,3")
+    cache = typediterable.ResultCache(tmp_path / "cache")
+    actual = list(typediterable.TypedIterable[int].cached(path, cache, reader=lambda f: f.read().split(",")))
+    assert actual == [1, 2, 3]
+
+
+def test_cached_key_depends_on_type(tmp_path: Path) -> None:
+    path = tmp_path / "data.txt"
+    path.write_text("1\n")
+    cache = typediterable.ResultCache(tmp_path / "cache")
+
+    @dataclass
+    class Changed:
+        value: int
+        extra: int = 0
+
+    assert cache.key(path, Item) == cache.key(path, Item)
+    assert cache.key(path, Item) != cache.key(path, Changed)
+    assert cache.key(path, Item) != cache.key(path, int)
+
+
+def test_cached_not_stored_on_error(tmp_path: Path) -> None:
+    path = tmp_path / "data.txt"
+    path.write_text("1\nx\n3\n")
+    cache = typediterable.ResultCache(tmp_path / "cache")
+
+    actual = list(typediterable.TypedIterable[int].cached(path, cache, on_error=lambda d, i, e: None))
+    assert actual == [1, 3]
+    assert os.listdir(tmp_path / "cache") == []
+
+
+def test_cached_not_stored_on_partial_iteration(tmp_path: Path) -> None:
+    path = tmp_path / "data.txt"
+    path.write_text("1\n2\n3\n")
+    cache = typediterable.ResultCache(tmp_path / "cache")
+
+    it = iter(typediterable.TypedIterable[int].cached(path, cache))
+    assert next(it) == 1
+    del it
+    assert os.listdir(tmp_path / "cache") == []
+
+
+def test_evict(tmp_path: Path) -> None:
+    cache = typediterable.ResultCache(tmp_path / "cache", max_bytes=0)
+    path = tmp_path / "data.txt"
+    path.write_text("1\n")
+
+    assert list(typediterable.TypedIterable[int].cached(path, cache)) == [1]
+    assert os.listdir(tmp_path / "cache") == []
+
+
+def test_cached_key_depends_on_reader_and_argument_type(tmp_path: Path) -> None:
+    path = tmp_path / "data.txt"
+    path.write_text("1,2\n3\n")
+    cache = typediterable.ResultCache(tmp_path / "cache")
+
+    assert list(typediterable.TypedIterable[str].cached(path, cache)) == ["1,2\n", "3\n"]
+    actual = list(typediterable.TypedIterable[str].cached(path, cache, reader=lambda f: f.read().split(",")))
+    assert actual == ["1", "2\n3\n"]
+    actual = list(typediterable.AdaptiveTypedIterable[str].cached(path, cache))
+    assert actual == ["1,2\n", "3\n"]
+    assert len(os.listdir(tmp_path / "cache")) == 3
+
+
+def test_cached_key_depends_on_constructor_body(tmp_path: Path) -> None:
+    path = tmp_path / "data.txt"
+    path.write_text("1\n")
+    cache = typediterable.ResultCache(tmp_path / "cache")
+
+    def define(factor: int, rename: bool) -> type:
+        if factor == 2 and not rename:
+
+            class Value:
+                def __init__(self, v: int):
+                    self.v = v * 2
+
+        elif factor == 3:
+
+            class Value:  # type: ignore [no-redef]
+                def __init__(self, v: int):
+                    self.v = v * 3
+
+        else:
+
+            class Value:  # type: ignore [no-redef]
+                def __init__(self, v: int):
+                    self.w = v * 2
+
+        return Value
+
+    keys = {cache.key(path, define(2, False)), cache.key(path, define(3, False)), cache.key(path, define(2, True))}
+    assert len(keys) == 3
+    assert cache.key(path, define(2, False)) == cache.key(path, define(2, False))
+
+
+class Unpicklable:
+    def __init__(self, value: str):
+        self.value = value
+        self.f = lambda: value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Unpicklable) and self.value == other.value
+
+
+def test_cached_fails_open_on_pickling_error(tmp_path: Path) -> None:
+    path = tmp_path / "data.txt"
+    path.write_text("1\n2\n3\n")
+    cache = typediterable.ResultCache(tmp_path / "cache", chunk_size=2)
+
+    actual = list(typediterable.TypedIterable[Unpicklable].cached(path, cache))
+    assert actual == [Unpicklable("1\n"), Unpicklable("2\n"), Unpicklable("3\n")]
+    assert os.listdir(tmp_path / "cache") == []
+
+
+def test_cached_key_depends_on_encoding(tmp_path: Path) -> None:
+    path = tmp_path / "data.txt"
+    path.write_bytes("é\n".encode("utf-8"))
+    cache = typediterable.ResultCache(tmp_path / "cache")
+
+    assert list(typediterable.TypedIterable[str].cached(path, cache)) == ["é\n"]
+    assert list(typediterable.TypedIterable[str].cached(path, cache, encoding="latin-1")) == ["Ã©\n"]
+    assert len(os.listdir(tmp_path / "cache")) == 2
@@ -1,6 +1,11 @@
+import importlib
 from dataclasses import dataclass
-from inspect import Parameter, Signature
-from typing import Any
+from decimal import Decimal
+from fractions import Fraction
+from inspect import Parameter, Signature, signature
+from pathlib import Path
+from typing import Any, List, Tuple
+from uuid import UUID
 
 import pytest
 from pytest_mock import MockerFixture
@@ -50,6 +55,19 @@ class TwoArgumentOneDefaultDataType(TwoArgumentDataType):
         super(TwoArgumentOneDefaultDataType, self).__init__(x, y)
 
 
+@pytest.fixture(autouse=True)
+def clear_auto_argument_type_cache() -> None:
+    core._cached_analyze_auto_argument_type.cache_clear()
+
+
+class CountedInt(int):
+    calls = 0
+
+    def __new__(cls, value: Any) -> "CountedInt":
+        cls.calls += 1
+        return super(CountedInt, cls).__new__(cls, value)
+
+
 @dataclass
 class User:
     name: str
@@ -556,3 +574,205 @@ def test_adoptive_cast() -> None:
     raw_data = ["aa", ("bb", 10), {"id": 20, "name": "cc"}]
     expected = [User(id=0, name="aa"), User(id=10, name="bb"), User(id=20, name="cc")]
     assert list(typediterable.AdaptiveTypedIterable[User](raw_data)) == expected
+
+
+def test_validate() -> None:
+    raw_data = [
+        {"x": 1, "y": 2, "text": "one"},
+        {"x": 1, "y": 2},
+        {"x": 1, "y": 2, "text": "three", "z": 3},
+        (1, 2, "four"),
+        {"y": 0, "x": 0, "text": "five"},
+    ]
+    actual = typediterable.TypedIterable[KeywordOnlyArgumentDataType].validate(raw_data)
+    assert actual == core.ValidationResult(total=5, failed=3, failed_indices=(1, 2, 3))
+    assert actual.passed == 2
+    assert not actual.truncated
+
+
+def test_validate_bounded_failed_indices() -> None:
+    raw_data = [(1,), (1, 2), (1, 2, 3), (), (4, 5)]
+    actual = typediterable.VariableLengthArgumentTypedIterable[TwoArgumentDataType].validate(
+        raw_data, max_failed_indices=2
+    )
+    assert actual == core.ValidationResult(total=5, failed=3, failed_indices=(0, 2))
+    assert actual.truncated
+
+
+def test_validate_with_construction() -> None:
+    raw_data = ["1", "x", "3", "y"]
+    actual = typediterable.TypedIterable[int].validate(raw_data, construct_every=2)
+    assert actual == core.ValidationResult(total=4, failed=0, failed_indices=(), constructed=2)
+    actual = typediterable.TypedIterable[int].validate(raw_data, construct_every=1)
+    assert actual == core.ValidationResult(total=4, failed=2, failed_indices=(1, 3), constructed=4)
+
+
+def test_validate_does_not_construct(mocker: MockerFixture) -> None:
+    t = mocker.Mock(side_effect=AssertionError)
+    t.__signature__ = Signature(parameters=(Parameter(name="x", kind=Parameter.POSITIONAL_OR_KEYWORD),))
+    actual = typediterable.TypedIterable[t].validate([1, 2, 3])
+    assert actual == core.ValidationResult(total=3)
+    t.assert_not_called()
+
+
+def test_resumable() -> None:
+    raw_data = ["1", "2", "x", "4", "5", "6"]
+    errors = []
+    checkpoints: List[core.Checkpoint] = []
+
+    def handler(d: str, idx: int, err: Exception) -> None:
+        errors.append((d, idx))
+
+    it = typediterable.TypedIterable[int].resumable(
+        raw_data, on_error=handler, on_checkpoint=checkpoints.append, checkpoint_every=2
+    )
+    assert [next(it), next(it), next(it)] == [1, 2, 4]
+    assert it.checkpoint == core.Checkpoint(element_index=4)
+    assert checkpoints == [core.Checkpoint(element_index=2)]
+
+    actual = list(typediterable.TypedIterable[int].resumable(raw_data, checkpoint=it.checkpoint, on_error=handler))
+    assert actual == [5, 6]
+    assert errors == [("x", 2)]
+
+
+def test_resumable_checkpoint_covers_only_returned_elements() -> None:
+    raw_data = ["1", "2", "3", "4", "5"]
+    checkpoints: List[core.Checkpoint] = []
+    processed = []
+    for d in typediterable.TypedIterable[int].resumable(raw_data, on_checkpoint=checkpoints.append, checkpoint_every=2):
+        if d == 4:
+            break
+        processed.append(d)
+    assert checkpoints == [core.Checkpoint(element_index=2)]
+
+    assert processed == [1, 2, 3]
+    assert list(typediterable.TypedIterable[int].resumable(raw_data, checkpoint=checkpoints[-1])) == [3, 4, 5]
+
+
+def test_resumable_rejects_non_positive_checkpoint_every() -> None:
+    with pytest.raises(ValueError):
+        typediterable.TypedIterable[int].resumable([], checkpoint_every=0)
+
+
+def test_resumable_skips_without_casting() -> None:
+    CountedInt.calls = 0
+    actual = list(
+        typediterable.TypedIterable[CountedInt].resumable(["1", "2", "3"], checkpoint=core.Checkpoint(element_index=2))
+    )
+    assert actual == [3]
+    assert CountedInt.calls == 1
+
+
+def test_resumable_file_offset(tmp_path: Path) -> None:
+    path = tmp_path / "data.txt"
+    path.write_text("1\n2\n3\n4\n")
+    with open(path) as fin:
+        it = typediterable.TypedIterable[int].resumable(fin)
+        assert [next(it), next(it)] == [1, 2]
+        checkpoint = it.checkpoint
+    assert checkpoint == core.Checkpoint(element_index=2, offset=4)
+    with open(path) as fin:
+        it = typediterable.TypedIterable[int].resumable(fin, checkpoint=checkpoint)
+        assert list(it) == [3, 4]
+        assert it.checkpoint == core.Checkpoint(element_index=4, offset=8)
+
+
+@pytest.mark.parametrize(
+    ["argument_type", "t", "raw_data"],
+    [
+        [core.ArgumentType.ONE_ARGUMENT, int, ["1", "x", "3"]],
+        [core.ArgumentType.VARIABLE_LENGTH_ARGUMENT, TwoArgumentDataType, [(1, 2), (1,), (3, 4)]],
+        [core.ArgumentType.VARIABLE_LENGTH_KEYWORD_ARGUMENT, TwoArgumentDataType, [{"x": 1, "y": 2}, {"x": 1}]],
+        [core.ArgumentType.K2O_FALLBACKABLE, Decimal, ["1", {"value": "2"}, "x"]],
+        [core.ArgumentType.ADAPTIVE, Decimal, ["1", ("2",), {"value": "3"}, "x", ("a", "b")]],
+        [core.ArgumentType.AUTO, KeywordOnlyArgumentDataType, [{"x": 1, "y": 2, "text": "a"}, {"x": 1}]],
+    ],
+)
+def test_codegen(argument_type: core.ArgumentType, t: Any, raw_data: List[Any]) -> None:
+    generated = core.GenericTypedIterableFactory(argument_type)[t]
+    fallback = core.GenericTypedIterableFactory(argument_type, codegen=False)[t]
+    assert generated.loop_source is not None
+    assert fallback.loop_source is None
+
+    generated_errors: List[Any] = []
+    fallback_errors: List[Any] = []
+    actual = list(
+        generated(raw_data, on_error=lambda d, i, e: generated_errors.append((d, i, type(e), type(e.__context__))))
+    )
+    expected = list(
+        fallback(raw_data, on_error=lambda d, i, e: fallback_errors.append((d, i, type(e), type(e.__context__))))
+    )
+    assert actual == expected
+    assert generated_errors == fallback_errors
+    assert len(generated_errors) > 0
+
+    with pytest.raises(Exception):
+        list(generated(raw_data))
+
+
+def test_loop_source() -> None:
+    assert "t(**d)" in core.generate_loop_source(core.ArgumentType.VARIABLE_LENGTH_KEYWORD_ARGUMENT)
+    assert typediterable.TypedIterable[User].loop_source == core.generate_loop_source(
+        core.ArgumentType.K2O_FALLBACKABLE
+    )
+
+
+def test_validate_does_not_consume_iterator_elements() -> None:
+    raw_data = [(i for i in (1, 2)), iter((3, 4))]
+    actual = typediterable.VariableLengthArgumentTypedIterable[TwoArgumentDataType].validate(
+        raw_data, construct_every=1
+    )
+    assert actual == core.ValidationResult(total=2, failed=0, failed_indices=(), constructed=2)
+
+
+@pytest.mark.parametrize(["qualified_name"], [[k] for k in core._BUILTIN_ARGUMENT_TYPES])
+def test_builtin_argument_types(qualified_name: Tuple[str, str]) -> None:
+    t = getattr(importlib.import_module(qualified_name[0]), qualified_name[1])
+    try:
+        expected = core._compute_argument_type_by_signature_summary(
+            core._compute_signature_summary_by_signature(signature(t))
+        )
+    except ValueError:
+        expected = core.ArgumentType.ONE_ARGUMENT
+    assert core._BUILTIN_ARGUMENT_TYPES[qualified_name] == expected
+    assert type(typediterable.TypedIterable[t]) is type(core.GenericTypedIterableFactory(expected)[t])
+
+
+def test_builtin_argument_types_keyword_arguments() -> None:
+    assert list(typediterable.TypedIterable[Fraction]([{"numerator": 1, "denominator": 2}, "3/4"])) == [
+        Fraction(1, 2),
+        Fraction(3, 4),
+    ]
+    assert list(typediterable.TypedIterable[UUID]([{"int": 5}])) == [UUID(int=5)]
+
+
+def test_codegen_respects_custom_cast() -> None:
+    class Upper(core.GenericTypedIterable[str]):
+        def _cast(self, d: Any) -> str:
+            return str(d).upper()
+
+    class Pair(core.GenericVariableLengthArgumentTypedIterable[TwoArgumentDataType]): ...
+
+    assert Upper(str).loop_source is None
+    assert list(Upper(str)(["a", "b"])) == ["A", "B"]
+    assert Pair(TwoArgumentDataType).loop_source is not None
+    assert list(Pair(TwoArgumentDataType)([(1, 2)])) == [TwoArgumentDataType(1, 2)]
+
+
+def test_signature_summary_names() -> None:
+    ss = core._compute_signature_summary_by_signature(signature(User))
+    assert ss == core.SignatureSummary(positional_or_keyword=core.IntRange(1, 2))
+    assert (ss.required_names, ss.optional_names) == (("name",), ("id",))
+    assert ss != tuple(ss._counts())
+    with pytest.raises(AttributeError):
+        ss.var_keyword = True
+
+
+def test_auto_signature_analysis_is_cached(mocker: MockerFixture) -> None:
+    spy = mocker.spy(core, "signature")
+    first = typediterable.TypedIterable[User]
+    second = typediterable.TypedIterable[User]
+    spy.assert_called_once_with(User)
+    assert type(first) is type(second) is core.GenericK2OFallbackableTypedIterable
+    assert first._signature_summary is second._signature_summary
+    assert list(second([{"name": "a"}, "b"])) == [User(name="a"), User(name="b")]
@@ -0,0 +1,68 @@
+import subprocess
+import sys
+from typing import Set
+
+import pytest
+
+
+def _loaded_modules(code: str) -> Set[str]:
+    out = subprocess.run(
+        [sys.executable, "-c", f"import sys\n{code}\nprint('\\n'.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return set(out.split())
+
+
+@pytest.mark.parametrize(
+    ["code"],
+    [
+        ["import typediterable"],
+        ["import typediterable\ntypediterable.TypedIterable"],
+        ["import typediterable\nlist(typediterable.TypedIterable[int](['1']))"],
+        ["import typediterable\nlist(typediterable.VariableLengthArgumentTypedIterable[complex]([(1, 2)]))"],
+    ],
+)
+def test_import_does_not_load_heavy_modules(code: str) -> None:
+    assert _loaded_modules(code).isdisjoint({"inspect", "dataclasses", "pickle", "hashlib"})
+
+
+def test_auto_subscription_loads_inspect() -> None:
+    modules = _loaded_modules("import typediterable\ntypediterable.TypedIterable[complex]")
+    assert "inspect" in modules
+    assert "typediterable.cache" not in modules
+
+
+def test_bare_import_does_not_load_typing() -> None:
+    assert _loaded_modules("import typediterable").isdisjoint({"typing", "enum", "typediterable.core"})
+
+
+def test_submodules_are_accessible_as_attributes() -> None:
+    import typediterable
+
+    assert typediterable.core.TypedIterable is typediterable.TypedIterable
+    assert typediterable.cache.ResultCache is typediterable.ResultCache
+    assert "core" in dir(typediterable)
+
+
+_PRELOADED = "import collections.abc, enum, importlib, itertools, typing"
+
+
+def _import_time(module: str) -> int:
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"{_PRELOADED}\nimport {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    cumulative = {
+        line.split("|")[2].strip(): int(line.split("|")[1])
+        for line in out.splitlines()
+        if line.startswith("import time:") and line.split("|")[1].strip().isdigit()
+    }
+    return cumulative[module]
+
+
+def test_import_time_budget() -> None:
+    assert _import_time("typediterable.core") < _import_time("inspect")
@@ -0,0 +1,114 @@
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable
+
+import pytest
+
+import typediterable
+from typediterable import profiling
+
+
+@dataclass
+class Item:
+    name: str
+    values: Any
+
+
+def _generate(n: int) -> Iterable[Dict[str, Any]]:
+    for i in range(n):
+        yield {"name": f"item-{i}", "values": list(range(100))}
+
+
+def test_profiled() -> None:
+    it = typediterable.TypedIterable[Item].profiled(_generate(10))
+    actual = list(it)
+    report = it.report()
+
+    assert len(actual) == 10
+    assert report.elements == 10
+    assert report.sampled == 10
+    assert report.source.samples == 10
+    assert report.cast.samples == 10
+    assert report.on_error == profiling.StageMemory()
+    assert report.source.bytes_per_element > 800
+    assert report.cast.bytes_per_element > 0
+    assert report.peak > 0
+    assert report.bytes_per_element == pytest.approx((report.source.allocated + report.cast.allocated) / report.sampled)
+
+
+def test_profiled_sampling_and_on_error() -> None:
+    errors = []
+
+    def handler(d: str, idx: int, err: Exception) -> None:
+        errors.append((d, idx, err))
+
+    it = typediterable.TypedIterable[int].profiled(["1", "x", "3", "y", "5"], on_error=handler, sample_every=2)
+    assert list(it) == [1, 3, 5]
+    report = it.report()
+
+    assert [(d, idx) for d, idx, _ in errors] == [("x", 1), ("y", 3)]
+    assert report.elements == 5
+    assert report.sampled == 3
+    assert report.cast.samples == 3
+    assert report.on_error.samples == 0
+
+
+def test_profiled_raises_without_on_error() -> None:
+    it = typediterable.TypedIterable[int].profiled(["1", "x"])
+    with pytest.raises(ValueError):
+        list(it)
+    assert it.report().cast.samples == 2
+
+
+def test_profiled_keeps_callers_peak() -> None:
+    tracemalloc.start()
+    try:
+        data = bytearray(5_000_000)
+        del data
+        peak = tracemalloc.get_traced_memory()[1]
+        it = typediterable.TypedIterable[int].profiled(["1", "2", "3"])
+        assert list(it) == [1, 2, 3]
+        assert tracemalloc.get_traced_memory()[1] >= peak
+        assert it.report().peak >= peak
+    finally:
+        tracemalloc.stop()
+
+
+def test_profiled_peak_includes_consumer() -> None:
+    it = typediterable.TypedIterable[int].profiled(["1", "2", "3"])
+    for _ in it:
+        data = bytearray(2_000_000)
+        del data
+    assert it.report().peak >= 2_000_000
+
+
+def test_profiled_invalid_sample_every() -> None:
+    with pytest.raises(ValueError):
+        typediterable.TypedIterable[int].profiled([], sample_every=0)
+
+
+def test_profiled_concurrent_iterators() -> None:
+    a = typediterable.TypedIterable[Item].profiled(_generate(3))
+    b = typediterable.TypedIterable[Item].profiled(_generate(5))
+    assert len(list(zip(a, b))) == 3
+    assert len(list(b)) == 2
+    assert not tracemalloc.is_tracing()
+
+    for report in (a.report(), b.report()):
+        assert report.source.bytes_per_element > 800
+        assert report.source.peak > 800
+        assert report.peak > 0
+    assert b.report().source.samples == 5
+
+
+class Nested:
+    def __init__(self, values: Any):
+        for _ in typediterable.TypedIterable[int].profiled(values):
+            data = bytearray(2_000_000)
+            del data
+
+
+def test_profiled_nested_keeps_outer_stage_peak() -> None:
+    it = typediterable.TypedIterable[Nested].profiled([["1", "2"]])
+    assert len(list(it)) == 1
+    assert it.report().cast.peak >= 2_000_000
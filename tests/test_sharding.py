@@ -0,0 +1,97 @@
+import json
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, List, Tuple
+
+import pytest
+
+import typediterable
+from typediterable import sharding
+
+
+@dataclass
+class Record:
+    id: int
+    name: str
+
+
+def _write_files(tmp_path: Path) -> List[Path]:
+    paths = []
+    n = 0
+    for i, size in enumerate([50, 3, 0, 17]):
+        path = tmp_path / f"data-{i}.jsonl"
+        with open(path, "w") as fout:
+            for _ in range(size):
+                fout.write(json.dumps({"id": n, "name": f"名前-{n}"}) + "\n")
+                n += 1
+        paths.append(path)
+    return paths
+
+
+def _run_shard(paths: List[Path], shard_index: int, shard_count: int) -> Tuple[List[int], sharding.ShardStats]:
+    it = typediterable.TypedIterable[Record].sharded(paths, shard_index, shard_count, parse=json.loads, split_bytes=128)
+    return [d.id for d in it], it.stats()
+
+
+@pytest.mark.parametrize(["shard_count"], [[1], [2], [3], [7]])
+def test_sharded(tmp_path: Path, shard_count: int) -> None:
+    paths = _write_files(tmp_path)
+    with ProcessPoolExecutor(max_workers=shard_count) as executor:
+        results = list(executor.map(_run_shard, [paths] * shard_count, range(shard_count), [shard_count] * shard_count))
+
+    ids = sorted(i for actual, _ in results for i in actual)
+    assert ids == list(range(70))
+    assert sum(stats.elements for _, stats in results) == 70
+    assert sum(stats.bytes_read for _, stats in results) == sum(p.stat().st_size for p in paths)
+    assert [stats.shard_index for _, stats in results] == list(range(shard_count))
+
+
+def test_sharded_on_error_position(tmp_path: Path) -> None:
+    path = tmp_path / "data.txt"
+    path.write_text("1\n22\nx\n4\nyy\n")
+    errors = []
+
+    def handler(d: Any, position: sharding.ShardPosition, err: Exception) -> None:
+        errors.append((d, position))
+
+    for shard_count in [1, 2, 3]:
+        for shard_index in range(shard_count):
+            list(
+                typediterable.TypedIterable[int].sharded(
+                    [path], shard_index, shard_count, on_error=handler, split_bytes=3
+                )
+            )
+    expected = [("x\n", sharding.ShardPosition(str(path), 5)), ("yy\n", sharding.ShardPosition(str(path), 9))]
+    assert sorted(errors) == sorted(expected * 3)
+
+
+def test_plan_segments(tmp_path: Path) -> None:
+    path = tmp_path / "data.txt"
+    path.write_text("0123456789")
+    assert sharding.plan_segments([path], 4) == [
+        sharding.Segment(str(path), 0, 4),
+        sharding.Segment(str(path), 4, 8),
+        sharding.Segment(str(path), 8, 10),
+    ]
+
+
+def test_shard_segments_error() -> None:
+    with pytest.raises(IndexError):
+        sharding.shard_segments([], 2, 2)
+    with pytest.raises(ValueError):
+        sharding.shard_segments([], 0, 0)
+
+
+def test_sharded_translates_line_endings(tmp_path: Path) -> None:
+    path = tmp_path / "data.txt"
+    path.write_bytes(b"a\r\nbb\r\nc\nd\r")
+    with open(path) as fin:
+        expected = list(typediterable.TypedIterable[str](fin))
+    for shard_count in [1, 2, 3]:
+        actual = [
+            d
+            for shard_index in range(shard_count)
+            for d in typediterable.TypedIterable[str].sharded([path], shard_index, shard_count, split_bytes=3)
+        ]
+        assert sorted(actual) == sorted(expected) == ["a\n", "bb\n", "c\n", "d\n"]
@@ -1,13 +1,45 @@
-from .core import (
-    AdaptiveTypedIterable,
-    TypedIterable,
-    VariableLengthArgumentTypedIterable,
-    VariableLengthKeywordArgumentTypedIterable,
-)
+from importlib import import_module
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, List
+
+    from .cache import ResultCache
+    from .core import (
+        AdaptiveTypedIterable,
+        TypedIterable,
+        VariableLengthArgumentTypedIterable,
+        VariableLengthKeywordArgumentTypedIterable,
+    )
 
 __all__ = [
     "TypedIterable",
     "VariableLengthArgumentTypedIterable",
     "VariableLengthKeywordArgumentTypedIterable",
     "AdaptiveTypedIterable",
+    "ResultCache",
 ]
+
+_exports = {
+    "TypedIterable": ".core",
+    "VariableLengthArgumentTypedIterable": ".core",
+    "VariableLengthKeywordArgumentTypedIterable": ".core",
+    "AdaptiveTypedIterable": ".core",
+    "ResultCache": ".cache",
+}
+
+_submodules = ("autotune", "cache", "core", "profiling", "sharding")
+
+
+def __getattr__(name: str) -> "Any":
+    if name in _submodules:
+        return import_module(f".{name}", __name__)
+    if name not in _exports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_exports[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> "List[str]":
+    return sorted(set(globals()) | set(__all__) | set(_submodules))
@@ -0,0 +1,242 @@
+import sys
+from itertools import chain, islice
+from time import perf_counter
+
+if sys.version_info < (3, 9):
+    from typing import Callable, Generator, Iterable, Iterator, Mapping
+else:
+    from collections.abc import Callable, Generator, Iterable, Iterator, Mapping
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Generic,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from .core import ArgumentType, GenericTypedIterableFactory
+
+if TYPE_CHECKING:
+    from .core import GenericTypedIterable
+
+T = TypeVar("T")
+
+_CHUNK_SECONDS = 0.01
+
+
+class AutoTuneDecision(NamedTuple):
+    element_index: int
+    argument_type: ArgumentType
+    sample_size: int
+    error_rate: float
+    latency: float
+    chunk_size: int
+
+
+class AutoTuneStats(NamedTuple):
+    elements: int
+    argument_type: ArgumentType
+    mismatches: int
+    fallbacks: int
+    decisions: Tuple[AutoTuneDecision, ...]
+
+
+def _first_argument_type(argument_type: ArgumentType, d: Any) -> ArgumentType:
+    if argument_type == ArgumentType.K2O_FALLBACKABLE:
+        if hasattr(d, "keys"):
+            return ArgumentType.VARIABLE_LENGTH_KEYWORD_ARGUMENT
+        return ArgumentType.ONE_ARGUMENT
+    if argument_type == ArgumentType.ADAPTIVE:
+        if isinstance(d, Iterable) and not isinstance(d, (str, bytes)):
+            if isinstance(d, Mapping):
+                return ArgumentType.VARIABLE_LENGTH_KEYWORD_ARGUMENT
+            return ArgumentType.VARIABLE_LENGTH_ARGUMENT
+        return ArgumentType.ONE_ARGUMENT
+    return argument_type
+
+
+class _Fallback(Exception): ...
+
+
+def _raise_fallback(d: Any, i: int, e: Exception) -> None:
+    raise _Fallback()
+
+
+class AutoTunedTypedIterator(Generic[T]):
+    def __init__(
+        self,
+        typed_iterable: "GenericTypedIterable[T]",
+        it: Iterable[Any],
+        on_error: Optional[Callable[[Any, int, Exception], None]] = None,
+        sample_size: int = 100,
+        resample_every: int = 10000,
+        chunk_size: int = 1000,
+    ):
+        if sample_size <= 0:
+            raise ValueError(sample_size)
+        if resample_every <= 0:
+            raise ValueError(resample_every)
+        if chunk_size <= 0:
+            raise ValueError(chunk_size)
+        self._elements = 0
+        self._argument_type = typed_iterable._argument_type
+        self._mismatches = 0
+        self._fallbacks = 0
+        self._decisions: List[AutoTuneDecision] = []
+        self._it = self._iterate(typed_iterable, it, on_error, sample_size, resample_every, chunk_size)
+
+    def _candidate(
+        self, typed_iterable: "GenericTypedIterable[T]", samples: List[Any]
+    ) -> "Optional[GenericTypedIterable[T]]":
+        if not typed_iterable._has_builtin_cast():
+            return None
+        argument_types = {_first_argument_type(typed_iterable._argument_type, d) for d in samples}
+        if len(argument_types) != 1:
+            return None
+        at = argument_types.pop()
+        if at == typed_iterable._argument_type:
+            return None
+        return GenericTypedIterableFactory(at, codegen=typed_iterable._codegen)[typed_iterable._t]
+
+    def _run(
+        self,
+        typed_iterable: "GenericTypedIterable[T]",
+        chunk: List[Any],
+        offset: int,
+        on_error: Optional[Callable[[Any, int, Exception], None]],
+    ) -> Generator[T, None, Tuple[float, int]]:
+        failed = 0
+
+        def handle_error(d: Any, j: int, e: Exception) -> None:
+            nonlocal failed
+            failed += 1
+            on_error(d, offset + j, e)  # type: ignore [misc]
+
+        elapsed = 0.0
+        start = perf_counter()
+        for res in typed_iterable(chunk, None if on_error is None else handle_error):
+            elapsed += perf_counter() - start
+            yield res
+            start = perf_counter()
+        elapsed += perf_counter() - start
+        return elapsed, failed
+
+    def _run_specialized(
+        self,
+        typed_iterable: "GenericTypedIterable[T]",
+        specialized: "GenericTypedIterable[T]",
+        chunk: List[Any],
+        offset: int,
+        on_error: Optional[Callable[[Any, int, Exception], None]],
+    ) -> Generator[T, None, Tuple[float, int]]:
+        elapsed = 0.0
+        fallbacks = 0
+        j = 0
+        while j < len(chunk):
+            start = perf_counter()
+            try:
+                for res in specialized(islice(chunk, j, None), _raise_fallback):
+                    elapsed += perf_counter() - start
+                    yield res
+                    j += 1
+                    start = perf_counter()
+            except _Fallback:
+                fallbacks += 1
+                self._fallbacks += 1
+            else:
+                elapsed += perf_counter() - start
+                break
+            index = offset + j
+            handler = None if on_error is None else (lambda d, _, e: on_error(d, index, e))
+            res_list = list(typed_iterable(chunk[j : j + 1], handler))
+            elapsed += perf_counter() - start
+            yield from res_list
+            j += 1
+        return elapsed, fallbacks
+
+    def _iterate(
+        self,
+        typed_iterable: "GenericTypedIterable[T]",
+        it: Iterable[Any],
+        on_error: Optional[Callable[[Any, int, Exception], None]],
+        sample_size: int,
+        resample_every: int,
+        chunk_size: int,
+    ) -> Iterator[T]:
+        source = iter(it)
+        i = 0
+        while True:
+            samples = list(islice(source, sample_size))
+            if not samples:
+                return
+            self._elements = i + len(samples)
+            self._argument_type = typed_iterable._argument_type
+            types = set(map(type, samples))
+            candidate = self._candidate(typed_iterable, samples)
+            k = len(samples) - len(samples) // 2 if candidate is not None else len(samples)
+            elapsed, failed = yield from self._run(typed_iterable, samples[:k], i, on_error)
+            latency = elapsed / k
+            error_rate = failed / k
+            specialized = None
+            if candidate is not None and k < len(samples):
+                elapsed, failed = yield from self._run_specialized(
+                    typed_iterable, candidate, samples[k:], i + k, on_error
+                )
+                if elapsed / (len(samples) - k) < latency:
+                    specialized = candidate
+                    latency = elapsed / (len(samples) - k)
+                    error_rate = failed / (len(samples) - k)
+            size = chunk_size if latency <= 0.0 else max(1, min(chunk_size, int(_CHUNK_SECONDS / latency)))
+            if specialized is not None:
+                self._argument_type = specialized._argument_type
+                if error_rate > 0.0:
+                    size = max(1, min(size, int(1 / error_rate)))
+            self._decisions.append(
+                AutoTuneDecision(
+                    element_index=i,
+                    argument_type=self._argument_type,
+                    sample_size=len(samples),
+                    error_rate=error_rate,
+                    latency=latency,
+                    chunk_size=size,
+                )
+            )
+            i += len(samples)
+            next_sampling = i + resample_every
+            while i < next_sampling:
+                chunk = list(islice(source, min(size, next_sampling - i)))
+                if not chunk:
+                    return
+                drifted = not types.issuperset(map(type, chunk))
+                if drifted:
+                    n = next(n for n, d in enumerate(chunk) if type(d) not in types)
+                    source = chain(chunk[n:], source)
+                    chunk = chunk[:n]
+                self._elements = i + len(chunk)
+                if specialized is None:
+                    yield from self._run(typed_iterable, chunk, i, on_error)
+                else:
+                    yield from self._run_specialized(typed_iterable, specialized, chunk, i, on_error)
+                i += len(chunk)
+                if drifted:
+                    self._mismatches += 1
+                    break
+
+    def stats(self) -> AutoTuneStats:
+        return AutoTuneStats(
+            elements=self._elements,
+            argument_type=self._argument_type,
+            mismatches=self._mismatches,
+            fallbacks=self._fallbacks,
+            decisions=tuple(self._decisions),
+        )
+
+    def __iter__(self) -> "AutoTunedTypedIterator[T]":
+        return self
+
+    def __next__(self) -> T:
+        return next(self._it)
@@ -0,0 +1,184 @@
+import hashlib
+import os
+import pickle
+import sys
+from inspect import signature
+from types import CodeType
+
+if sys.version_info < (3, 9):
+    from typing import Callable, Iterable, Iterator
+else:
+    from collections.abc import Callable, Iterable, Iterator
+
+from typing import IO, Any, List, Optional, Union
+
+
+def _file_digest(path: Union[str, "os.PathLike[str]"], block_size: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as fin:
+        for block in iter(lambda: fin.read(block_size), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+_VOLATILE_MEMBERS = frozenset({"__slotnames__", "_abc_impl"})
+
+
+def _constant_repr(x: Any) -> str:
+    if isinstance(x, CodeType):
+        return _code_digest(x)
+    if isinstance(x, tuple):
+        return "(" + ",".join(_constant_repr(c) for c in x) + ")"
+    if isinstance(x, frozenset):
+        return "{" + ",".join(sorted(_constant_repr(c) for c in x)) + "}"
+    return repr(x)
+
+
+def _code_digest(code: CodeType) -> str:
+    parts = [
+        code.co_code.hex(),
+        _constant_repr(code.co_consts),
+        repr(code.co_names),
+        repr(code.co_varnames),
+        repr(code.co_freevars),
+        repr(code.co_cellvars),
+    ]
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def _callable_fingerprint(f: Any) -> str:
+    parts = [getattr(f, "__module__", None) or "", getattr(f, "__qualname__", None) or repr(f)]
+    code = getattr(f, "__code__", None)
+    if code is not None:
+        parts.append(_code_digest(code))
+        parts.append(_constant_repr(getattr(f, "__defaults__", None)))
+        parts.append(repr(sorted((getattr(f, "__kwdefaults__", None) or {}).items())))
+    return "\0".join(parts)
+
+
+def _type_fingerprint(t: Any) -> str:
+    parts = [getattr(t, "__module__", ""), getattr(t, "__qualname__", repr(t))]
+    try:
+        parts.append(str(signature(t)))
+    except (TypeError, ValueError):
+        ...
+    if isinstance(t, type):
+        for klass in t.__mro__:
+            if klass is object:
+                continue
+            members = {k: v for k, v in vars(klass).items() if k not in _VOLATILE_MEMBERS}
+            parts.append(",".join(sorted(members)))
+            for name in sorted(members):
+                f = members[name]
+                if isinstance(f, (staticmethod, classmethod)):
+                    f = f.__func__
+                if isinstance(f, property):
+                    f = f.fget
+                if hasattr(f, "__code__"):
+                    parts.append(_callable_fingerprint(f))
+    else:
+        parts.append(_callable_fingerprint(t))
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    def __init__(self, directory: Union[str, "os.PathLike[str]"], max_bytes: int = 1 << 30, chunk_size: int = 1000):
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._chunk_size = chunk_size
+        os.makedirs(directory, exist_ok=True)
+
+    def key(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        t: Any,
+        argument_type: str = "",
+        reader: Optional[Callable[..., Any]] = None,
+        cast: Optional[Callable[..., Any]] = None,
+        encoding: str = "",
+    ) -> str:
+        parts = [
+            _file_digest(path),
+            _type_fingerprint(t),
+            argument_type,
+            "" if reader is None else _callable_fingerprint(reader),
+            "" if cast is None else _callable_fingerprint(cast),
+            encoding,
+        ]
+        return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._directory, f"{key}.pickle")
+
+    def load(self, key: str) -> Optional[Iterator[Any]]:
+        p = self._path(key)
+        try:
+            fin = open(p, "rb")
+        except FileNotFoundError:
+            return None
+        os.utime(p)
+        return self._read(fin)
+
+    def _read(self, fin: IO[bytes]) -> Iterator[Any]:
+        with fin:
+            while True:
+                try:
+                    chunk = pickle.load(fin)
+                except EOFError:
+                    return
+                yield from chunk
+
+    def store(self, key: str, it: Iterable[Any], should_commit: Optional[Callable[[], bool]] = None) -> Iterator[Any]:
+        p = self._path(key)
+        tmp = f"{p}.{os.getpid()}.tmp"
+        committed = False
+        fout: Optional[IO[bytes]] = open(tmp, "wb")
+        try:
+            chunk: List[Any] = []
+            for d in it:
+                if fout is not None:
+                    chunk.append(d)
+                    if len(chunk) >= self._chunk_size:
+                        fout = self._dump(chunk, fout)
+                        chunk = []
+                yield d
+            if fout is not None and chunk:
+                fout = self._dump(chunk, fout)
+            if fout is not None:
+                fout.close()
+                if should_commit is None or should_commit():
+                    os.replace(tmp, p)
+                    committed = True
+        finally:
+            if fout is not None:
+                fout.close()
+            if not committed and os.path.exists(tmp):
+                os.remove(tmp)
+        self.evict()
+
+    def _dump(self, chunk: List[Any], fout: IO[bytes]) -> Optional[IO[bytes]]:
+        try:
+            pickle.dump(chunk, fout, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            fout.close()
+            return None
+        return fout
+
+    def evict(self) -> None:
+        entries = []
+        for name in os.listdir(self._directory):
+            if not name.endswith(".pickle"):
+                continue
+            st = os.stat(os.path.join(self._directory, name))
+            entries.append((st.st_mtime, st.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self._max_bytes:
+                break
+            os.remove(os.path.join(self._directory, name))
+            total -= size
+
+    def clear(self) -> None:
+        for name in os.listdir(self._directory):
+            if name.endswith(".pickle"):
+                os.remove(os.path.join(self._directory, name))
@@ -1,14 +1,37 @@
 import sys
-from dataclasses import dataclass
-from inspect import Parameter, Signature, signature
+from functools import lru_cache
+from io import IOBase
+from itertools import islice, starmap
+from os import PathLike
 
 if sys.version_info < (3, 9):
-    from typing import Callable, Iterable, Mapping
+    from typing import Callable, Iterable, Iterator, Mapping, Sized
 else:
-    from collections.abc import Callable, Iterable, Mapping
+    from collections.abc import Callable, Iterable, Iterator, Mapping, Sized
 
 from enum import Enum
-from typing import Any, Generic, Optional, Tuple, Type, TypeVar, Union
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generic,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from inspect import Signature
+
+    from .autotune import AutoTunedTypedIterator
+    from .cache import ResultCache
+    from .profiling import ProfiledTypedIterator
+    from .sharding import ShardedTypedIterator, ShardPosition
 
 T = TypeVar("T")
 
@@ -76,22 +99,92 @@ def min_num(x: Union[int, IntRange]) -> int:
     return x.min
 
 
-@dataclass(frozen=True)
 class SignatureSummary:
-    positional_only: Union[int, IntRange] = 0
-    positional_or_keyword: Union[int, IntRange] = 0
-    var_positional: bool = False
-    keyword_only: Union[int, IntRange] = 0
-    var_keyword: bool = False
+    __slots__ = (
+        "positional_only",
+        "positional_or_keyword",
+        "var_positional",
+        "keyword_only",
+        "var_keyword",
+        "required_names",
+        "optional_names",
+    )
+    positional_only: Union[int, IntRange]
+    positional_or_keyword: Union[int, IntRange]
+    var_positional: bool
+    keyword_only: Union[int, IntRange]
+    var_keyword: bool
+    required_names: Tuple[str, ...]
+    optional_names: Tuple[str, ...]
+
+    def __init__(
+        self,
+        positional_only: Union[int, IntRange] = 0,
+        positional_or_keyword: Union[int, IntRange] = 0,
+        var_positional: bool = False,
+        keyword_only: Union[int, IntRange] = 0,
+        var_keyword: bool = False,
+        required_names: Tuple[str, ...] = (),
+        optional_names: Tuple[str, ...] = (),
+    ):
+        object.__setattr__(self, "positional_only", positional_only)
+        object.__setattr__(self, "positional_or_keyword", positional_or_keyword)
+        object.__setattr__(self, "var_positional", var_positional)
+        object.__setattr__(self, "keyword_only", keyword_only)
+        object.__setattr__(self, "var_keyword", var_keyword)
+        object.__setattr__(self, "required_names", required_names)
+        object.__setattr__(self, "optional_names", optional_names)
+
+    def _counts(self) -> Tuple[Any, ...]:
+        return (
+            self.positional_only,
+            self.positional_or_keyword,
+            self.var_positional,
+            self.keyword_only,
+            self.var_keyword,
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, SignatureSummary):
+            return self._counts() == other._counts()
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(tuple(max_num(x) if isinstance(x, IntRange) else x for x in self._counts()))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"cannot delete field {name!r}")
 
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{self.__class__.__name__}({fields})"
+
+
+def signature(t: Any) -> "Signature":
+    from inspect import signature as _signature
+
+    return _signature(t)
+
+
+def _compute_signature_summary_by_signature(s: "Signature") -> SignatureSummary:
+    from inspect import Parameter
 
-def _compute_signature_summary_by_signature(s: Signature) -> SignatureSummary:
     positional_only: Union[int, IntRange] = 0
     positional_or_keyword: Union[int, IntRange] = 0
     var_positional = False
     keyword_only: Union[int, IntRange] = 0
     var_keyword = False
+    required_names: List[str] = []
+    optional_names: List[str] = []
     for p in s.parameters.values():
+        if p.kind in (Parameter.POSITIONAL_OR_KEYWORD, Parameter.KEYWORD_ONLY):
+            if p.default != Parameter.empty:
+                optional_names.append(p.name)
+            else:
+                required_names.append(p.name)
         if p.kind == Parameter.POSITIONAL_ONLY:
             if p.default != Parameter.empty:
                 if isinstance(positional_only, int):
@@ -126,9 +219,44 @@ def _compute_signature_summary_by_signature(s: Signature) -> SignatureSummary:
         var_positional=var_positional,
         keyword_only=keyword_only,
         var_keyword=var_keyword,
+        required_names=tuple(required_names),
+        optional_names=tuple(optional_names),
     )
 
 
+_BUILTIN_ARGUMENT_TYPES = {
+    ("builtins", "int"): ArgumentType.ONE_ARGUMENT,
+    ("builtins", "float"): ArgumentType.ONE_ARGUMENT,
+    ("builtins", "str"): ArgumentType.ONE_ARGUMENT,
+    ("builtins", "bool"): ArgumentType.ONE_ARGUMENT,
+    ("builtins", "bytes"): ArgumentType.ONE_ARGUMENT,
+    ("builtins", "bytearray"): ArgumentType.ONE_ARGUMENT,
+    ("builtins", "list"): ArgumentType.ONE_ARGUMENT,
+    ("builtins", "tuple"): ArgumentType.ONE_ARGUMENT,
+    ("builtins", "set"): ArgumentType.ONE_ARGUMENT,
+    ("builtins", "frozenset"): ArgumentType.ONE_ARGUMENT,
+    ("builtins", "dict"): ArgumentType.ONE_ARGUMENT,
+    ("decimal", "Decimal"): ArgumentType.K2O_FALLBACKABLE,
+    ("fractions", "Fraction"): ArgumentType.K2O_FALLBACKABLE,
+    ("datetime", "datetime"): ArgumentType.ONE_ARGUMENT,
+    ("datetime", "date"): ArgumentType.ONE_ARGUMENT,
+    ("datetime", "time"): ArgumentType.ONE_ARGUMENT,
+    ("datetime", "timedelta"): ArgumentType.ONE_ARGUMENT,
+    ("uuid", "UUID"): ArgumentType.K2O_FALLBACKABLE,
+}
+
+
+def _qualified_name(t: Any) -> Tuple[str, str]:
+    return getattr(t, "__module__", ""), getattr(t, "__qualname__", "")
+
+
+def _compute_signature_summary(t: Any) -> Optional[SignatureSummary]:
+    try:
+        return _compute_signature_summary_by_signature(signature(t))
+    except ValueError:
+        return None
+
+
 def _compute_argument_type_by_signature_summary(ss: SignatureSummary) -> ArgumentType:
     if max_num(ss.positional_only) > 0 and max_num(ss.keyword_only) > 0:
         raise ValueError("signature not supported")
@@ -154,16 +282,180 @@ def _compute_argument_type_by_signature_summary(ss: SignatureSummary) -> Argumen
     return ArgumentType.VARIABLE_LENGTH_KEYWORD_ARGUMENT
 
 
+def _analyze_auto_argument_type(t: Any) -> Tuple[ArgumentType, Optional[SignatureSummary]]:
+    at = _BUILTIN_ARGUMENT_TYPES.get(_qualified_name(t))
+    if at is not None:
+        return at, None
+    ss = _compute_signature_summary(t)
+    if ss is None:
+        return ArgumentType.ONE_ARGUMENT, None
+    return _compute_argument_type_by_signature_summary(ss), ss
+
+
+_cached_analyze_auto_argument_type = lru_cache(maxsize=1024)(_analyze_auto_argument_type)
+
+
+def _resolve_auto_argument_type(t: Any) -> Tuple[ArgumentType, Optional[SignatureSummary]]:
+    try:
+        hash(t)
+    except TypeError:
+        return _analyze_auto_argument_type(t)
+    return _cached_analyze_auto_argument_type(t)
+
+
+def _accepts_one_argument(ss: SignatureSummary) -> bool:
+    if min_num(ss.positional_only) + min_num(ss.positional_or_keyword) > 1 or min_num(ss.keyword_only) > 0:
+        return False
+    return max_num(ss.positional_only) + max_num(ss.positional_or_keyword) >= 1 or ss.var_positional
+
+
+def _accepts_positional_arguments(ss: SignatureSummary, d: Any) -> bool:
+    if not isinstance(d, Iterable) or isinstance(d, (str, bytes, Mapping)) or min_num(ss.keyword_only) > 0:
+        return False
+    if not isinstance(d, Sized):
+        return True
+    n = len(d)
+    if n < min_num(ss.positional_only) + min_num(ss.positional_or_keyword):
+        return False
+    return ss.var_positional or n <= max_num(ss.positional_only) + max_num(ss.positional_or_keyword)
+
+
+def _accepts_keyword_arguments(ss: SignatureSummary, d: Any) -> bool:
+    if not isinstance(d, Mapping) or min_num(ss.positional_only) > 0:
+        return False
+    keys = set(d.keys())
+    if not keys.issuperset(ss.required_names):
+        return False
+    return ss.var_keyword or keys.issubset(ss.required_names + ss.optional_names)
+
+
+class ValidationResult(NamedTuple):
+    total: int = 0
+    failed: int = 0
+    failed_indices: Tuple[int, ...] = ()
+    constructed: int = 0
+
+    @property
+    def passed(self) -> int:
+        return self.total - self.failed
+
+    @property
+    def truncated(self) -> bool:
+        return len(self.failed_indices) < self.failed
+
+
+class Checkpoint(NamedTuple):
+    element_index: int = 0
+    offset: Optional[int] = None
+
+
+_CAST_SOURCES = {
+    ArgumentType.ONE_ARGUMENT: "r = t(d)",
+    ArgumentType.VARIABLE_LENGTH_ARGUMENT: "r = t(*d)",
+    ArgumentType.VARIABLE_LENGTH_KEYWORD_ARGUMENT: "r = t(**d)",
+    ArgumentType.K2O_FALLBACKABLE: """fallback = False
+try:
+    r = t(**d)
+except TypeError:
+    fallback = True
+if fallback:
+    r = t(d)""",
+    ArgumentType.ADAPTIVE: """fallback = True
+if isinstance(d, Iterable) and not isinstance(d, (str, bytes)):
+    fallback = False
+    if isinstance(d, Mapping):
+        try:
+            r = t(**d)
+        except TypeError:
+            fallback = True
+    else:
+        try:
+            r = t(*d)
+        except TypeError:
+            fallback = True
+if fallback:
+    r = t(d)""",
+}
+
+_FAST_LOOP_SOURCES = {
+    ArgumentType.ONE_ARGUMENT: "yield from map(t, it)",
+    ArgumentType.VARIABLE_LENGTH_ARGUMENT: "yield from starmap(t, it)",
+}
+
+_LOOP_TEMPLATE = """def make_loop(t):
+    def loop(it, on_error):
+        if on_error is not None:
+            for i, d in enumerate(it):
+                try:
+{cast_with_handler}
+                except Exception as e:
+                    on_error(d, i, e)
+                else:
+                    yield r
+        else:
+{fast_loop}
+    return loop
+"""
+
+_LoopFunction = Callable[[Iterable[Any], Optional[Callable[[Any, int, Exception], None]]], Iterator[Any]]
+_loop_factories: Dict[ArgumentType, Tuple[str, Callable[[Any], _LoopFunction]]] = {}
+
+
+def _indent(source: str, n: int) -> str:
+    return "\n".join(" " * n + line for line in source.splitlines())
+
+
+def generate_loop_source(argument_type: ArgumentType) -> str:
+    cast = _CAST_SOURCES[argument_type]
+    fast_loop = _FAST_LOOP_SOURCES.get(argument_type, f"for d in it:\n{_indent(cast, 4)}\n    yield r")
+    return _LOOP_TEMPLATE.format(cast_with_handler=_indent(cast, 20), fast_loop=_indent(fast_loop, 12))
+
+
+def _get_loop_factory(argument_type: ArgumentType) -> Tuple[str, Callable[[Any], _LoopFunction]]:
+    if argument_type not in _loop_factories:
+        source = generate_loop_source(argument_type)
+        namespace: Dict[str, Any] = {"Iterable": Iterable, "Mapping": Mapping, "starmap": starmap}
+        exec(compile(source, f"<typediterable loop {argument_type.value}>", "exec"), namespace)
+        _loop_factories[argument_type] = (source, namespace["make_loop"])
+    return _loop_factories[argument_type]
+
+
 class GenericTypedIterable(Generic[T]):
-    def __init__(self, t: Type[T]):
+    _argument_type = ArgumentType.ONE_ARGUMENT
+
+    def __init__(self, t: Type[T], signature_summary: Optional[SignatureSummary] = None, codegen: bool = True):
         self._t = t
+        self._signature_summary = signature_summary
+        self._codegen = codegen
+        self._loop_source: Optional[str] = None
+        self._loop: Optional[_LoopFunction] = None
+        if codegen and self._has_builtin_cast():
+            self._loop_source, make_loop = _get_loop_factory(self._argument_type)
+            self._loop = make_loop(t)
+
+    @property
+    def loop_source(self) -> Optional[str]:
+        return self._loop_source
+
+    def _has_builtin_cast(self) -> bool:
+        return _BUILTIN_CASTS.get(self._argument_type) is type(self)._cast
 
     def _cast(self, d: Any) -> T:
         return self._t(d)  # type: ignore [call-arg]
 
+    def _accepts(self, ss: SignatureSummary, d: Any) -> bool:
+        return _accepts_one_argument(ss)
+
     def __call__(
         self, it: Iterable[Any], on_error: Optional[Callable[[Any, int, Exception], None]] = None
     ) -> Iterable[T]:
+        if self._loop is not None:
+            return self._loop(it, on_error)
+        return self._iterate(it, on_error)
+
+    def _iterate(
+        self, it: Iterable[Any], on_error: Optional[Callable[[Any, int, Exception], None]] = None
+    ) -> Iterator[T]:
         if on_error is not None:
             for i, d in enumerate(it):
                 try:
@@ -174,18 +466,127 @@ class GenericTypedIterable(Generic[T]):
             for d in it:
                 yield self._cast(d)
 
+    def validate(self, it: Iterable[Any], max_failed_indices: int = 100, construct_every: int = 0) -> ValidationResult:
+        ss = self._signature_summary if self._signature_summary is not None else _compute_signature_summary(self._t)
+        total = 0
+        failed = 0
+        failed_indices: List[int] = []
+        constructed = 0
+        for i, d in enumerate(it):
+            total += 1
+            ok = ss is None or self._accepts(ss, d)
+            if ok and construct_every > 0 and i % construct_every == 0:
+                constructed += 1
+                try:
+                    self._cast(d)
+                except Exception:
+                    ok = False
+            if not ok:
+                failed += 1
+                if len(failed_indices) < max_failed_indices:
+                    failed_indices.append(i)
+        return ValidationResult(
+            total=total, failed=failed, failed_indices=tuple(failed_indices), constructed=constructed
+        )
+
+    def resumable(
+        self,
+        it: Iterable[Any],
+        checkpoint: Optional[Checkpoint] = None,
+        on_error: Optional[Callable[[Any, int, Exception], None]] = None,
+        on_checkpoint: Optional[Callable[[Checkpoint], None]] = None,
+        checkpoint_every: int = 1000,
+    ) -> "ResumableTypedIterator[T]":
+        return ResumableTypedIterator[T](self, it, checkpoint, on_error, on_checkpoint, checkpoint_every)
+
+    def profiled(
+        self,
+        it: Iterable[Any],
+        on_error: Optional[Callable[[Any, int, Exception], None]] = None,
+        sample_every: int = 1,
+    ) -> "ProfiledTypedIterator[T]":
+        from .profiling import ProfiledTypedIterator
+
+        return ProfiledTypedIterator[T](self, it, on_error, sample_every)
+
+    def autotuned(
+        self,
+        it: Iterable[Any],
+        on_error: Optional[Callable[[Any, int, Exception], None]] = None,
+        sample_size: int = 100,
+        resample_every: int = 10000,
+        chunk_size: int = 1000,
+    ) -> "AutoTunedTypedIterator[T]":
+        from .autotune import AutoTunedTypedIterator
+
+        return AutoTunedTypedIterator[T](self, it, on_error, sample_size, resample_every, chunk_size)
+
+    def sharded(
+        self,
+        sources: Iterable[Union[str, "PathLike[str]"]],
+        shard_index: int,
+        shard_count: int,
+        on_error: Optional[Callable[[Any, "ShardPosition", Exception], None]] = None,
+        parse: Optional[Callable[[str], Any]] = None,
+        split_bytes: int = 64 << 20,
+        encoding: str = "utf-8",
+    ) -> "ShardedTypedIterator[T]":
+        from .sharding import ShardedTypedIterator, plan_segments, shard_segments
+
+        segments = shard_segments(plan_segments(sources, split_bytes), shard_index, shard_count)
+        return ShardedTypedIterator[T](self, segments, shard_index, shard_count, on_error, parse, encoding)
+
+    def cached(
+        self,
+        path: Union[str, "PathLike[str]"],
+        cache: "ResultCache",
+        reader: Optional[Callable[[IO[str]], Iterable[Any]]] = None,
+        on_error: Optional[Callable[[Any, int, Exception], None]] = None,
+        encoding: str = "utf-8",
+    ) -> Iterator[T]:
+        key = cache.key(path, self._t, self._argument_type.value, reader, type(self)._cast, encoding)
+        hit = cache.load(key)
+        if hit is not None:
+            yield from hit
+            return
+        failed = False
+
+        def handle_error(d: Any, i: int, e: Exception) -> None:
+            nonlocal failed
+            failed = True
+            on_error(d, i, e)  # type: ignore [misc]
+
+        with open(path, "r", encoding=encoding) as fin:
+            yield from cache.store(
+                key,
+                self(fin if reader is None else reader(fin), on_error=None if on_error is None else handle_error),
+                should_commit=lambda: not failed,
+            )
+
 
 class GenericVariableLengthArgumentTypedIterable(Generic[T], GenericTypedIterable[T]):
+    _argument_type = ArgumentType.VARIABLE_LENGTH_ARGUMENT
+
     def _cast(self, d: Any) -> T:
         return self._t(*d)
 
+    def _accepts(self, ss: SignatureSummary, d: Any) -> bool:
+        return _accepts_positional_arguments(ss, d)
+
 
 class GenericVariableLengthArgumentKeywordTypedIterable(Generic[T], GenericTypedIterable[T]):
+    _argument_type = ArgumentType.VARIABLE_LENGTH_KEYWORD_ARGUMENT
+
     def _cast(self, d: Any) -> T:
         return self._t(**d)
 
+    def _accepts(self, ss: SignatureSummary, d: Any) -> bool:
+        return _accepts_keyword_arguments(ss, d)
+
 
 class GenericK2OFallbackableTypedIterable(Generic[T], GenericTypedIterable[T]):
+    _argument_type = ArgumentType.K2O_FALLBACKABLE
+
     def _cast(self, d: Any) -> T:
         try:
             return self._t(**d)
@@ -193,8 +594,13 @@ class GenericK2OFallbackableTypedIterable(Generic[T], GenericTypedIterable[T]):
             ...
         return self._t(d)  # type: ignore [call-arg]
 
+    def _accepts(self, ss: SignatureSummary, d: Any) -> bool:
+        return _accepts_keyword_arguments(ss, d) or _accepts_one_argument(ss)
+
 
 class GenericAdaptiveTypedIterable(Generic[T], GenericTypedIterable[T]):
+    _argument_type = ArgumentType.ADAPTIVE
+
     def _cast(self, d: Any) -> T:
         if isinstance(d, Iterable) and not isinstance(d, (str, bytes)):
             if isinstance(d, Mapping):
@@ -209,28 +615,100 @@ class GenericAdaptiveTypedIterable(Generic[T], GenericTypedIterable[T]):
                     ...
         return self._t(d)  # type: ignore [call-arg]
 
+    def _accepts(self, ss: SignatureSummary, d: Any) -> bool:
+        return _accepts_keyword_arguments(ss, d) or _accepts_positional_arguments(ss, d) or _accepts_one_argument(ss)
+
+
+class ResumableTypedIterator(Generic[T]):
+    def __init__(
+        self,
+        typed_iterable: GenericTypedIterable[T],
+        it: Iterable[Any],
+        checkpoint: Optional[Checkpoint] = None,
+        on_error: Optional[Callable[[Any, int, Exception], None]] = None,
+        on_checkpoint: Optional[Callable[[Checkpoint], None]] = None,
+        checkpoint_every: int = 1000,
+    ):
+        if checkpoint_every <= 0:
+            raise ValueError(checkpoint_every)
+        start = 0 if checkpoint is None else checkpoint.element_index
+        source: Iterable[Any]
+        if isinstance(it, IOBase) and it.seekable():
+            self._file: Optional[IOBase] = it
+            if checkpoint is not None and checkpoint.offset is not None:
+                it.seek(checkpoint.offset)
+                source = iter(it.readline, it.read(0))
+            else:
+                source = islice(iter(it.readline, it.read(0)), start, None)
+        else:
+            self._file = None
+            source = islice(it, start, None)
+        self._start = start
+        self._yielded = 0
+        self._failed = 0
+        self._on_error = on_error
+        self._on_checkpoint = on_checkpoint
+        self._checkpoint_every = checkpoint_every
+        self._next_checkpoint = start + checkpoint_every
+        self._it = iter(typed_iterable(source, on_error=None if on_error is None else self._handle_error))
+
+    def _handle_error(self, d: Any, i: int, e: Exception) -> None:
+        self._failed += 1
+        self._on_error(d, self._start + i, e)  # type: ignore [misc]
+
+    @property
+    def index(self) -> int:
+        return self._start + self._yielded + self._failed
+
+    @property
+    def checkpoint(self) -> Checkpoint:
+        return Checkpoint(element_index=self.index, offset=None if self._file is None else self._file.tell())
+
+    def __iter__(self) -> "ResumableTypedIterator[T]":
+        return self
+
+    def __next__(self) -> T:
+        if self._on_checkpoint is not None and self.index >= self._next_checkpoint:
+            self._on_checkpoint(self.checkpoint)
+            self._next_checkpoint = self.index + self._checkpoint_every
+        try:
+            res = next(self._it)
+        except StopIteration:
+            if self._on_checkpoint is not None:
+                self._on_checkpoint(self.checkpoint)
+            raise
+        self._yielded += 1
+        return res
+
+
+_BUILTIN_CASTS = {
+    ArgumentType.ONE_ARGUMENT: GenericTypedIterable._cast,
+    ArgumentType.VARIABLE_LENGTH_ARGUMENT: GenericVariableLengthArgumentTypedIterable._cast,
+    ArgumentType.VARIABLE_LENGTH_KEYWORD_ARGUMENT: GenericVariableLengthArgumentKeywordTypedIterable._cast,
+    ArgumentType.K2O_FALLBACKABLE: GenericK2OFallbackableTypedIterable._cast,
+    ArgumentType.ADAPTIVE: GenericAdaptiveTypedIterable._cast,
+}
+
 
 class GenericTypedIterableFactory:
-    def __init__(self, argument_type: ArgumentType = ArgumentType.ONE_ARGUMENT):
+    def __init__(self, argument_type: ArgumentType = ArgumentType.ONE_ARGUMENT, codegen: bool = True):
         self._argument_type = argument_type
+        self._codegen = codegen
 
     def __getitem__(self, t: Type[T]) -> GenericTypedIterable[T]:
         at = self._argument_type
+        ss = None
         if at == ArgumentType.AUTO:
-            try:
-                sig = signature(t)
-            except ValueError:
-                return GenericTypedIterable[T](t)
-            at = _compute_argument_type_by_signature_summary(_compute_signature_summary_by_signature(sig))
+            at, ss = _resolve_auto_argument_type(t)
         if at == ArgumentType.VARIABLE_LENGTH_ARGUMENT:
-            return GenericVariableLengthArgumentTypedIterable[T](t)
+            return GenericVariableLengthArgumentTypedIterable[T](t, ss, codegen=self._codegen)
         elif at == ArgumentType.VARIABLE_LENGTH_KEYWORD_ARGUMENT:
-            return GenericVariableLengthArgumentKeywordTypedIterable[T](t)
+            return GenericVariableLengthArgumentKeywordTypedIterable[T](t, ss, codegen=self._codegen)
         elif at == ArgumentType.K2O_FALLBACKABLE:
-            return GenericK2OFallbackableTypedIterable[T](t)
+            return GenericK2OFallbackableTypedIterable[T](t, ss, codegen=self._codegen)
         elif at == ArgumentType.ADAPTIVE:
-            return GenericAdaptiveTypedIterable[T](t)
-        return GenericTypedIterable[T](t)
+            return GenericAdaptiveTypedIterable[T](t, ss, codegen=self._codegen)
+        return GenericTypedIterable[T](t, ss, codegen=self._codegen)
 
 
 TypedIterable = GenericTypedIterableFactory(argument_type=ArgumentType.AUTO)
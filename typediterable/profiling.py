@@ -0,0 +1,185 @@
+import sys
+import tracemalloc
+
+if sys.version_info < (3, 9):
+    from typing import Callable, Iterable, Iterator
+else:
+    from collections.abc import Callable, Iterable, Iterator
+
+from typing import TYPE_CHECKING, Any, Generic, List, NamedTuple, Optional, TypeVar
+
+if TYPE_CHECKING:
+    from .core import GenericTypedIterable
+
+T = TypeVar("T")
+
+_SOURCE = 0
+_CAST = 1
+_ON_ERROR = 2
+_END = object()
+
+_active: List["ProfiledTypedIterator[Any]"] = []
+_started = False
+
+
+def _start_tracing(profiler: "ProfiledTypedIterator[Any]") -> None:
+    global _started
+    if not _active:
+        _started = not tracemalloc.is_tracing()
+        if _started:
+            tracemalloc.start()
+    _active.append(profiler)
+
+
+def _stop_tracing(profiler: "ProfiledTypedIterator[Any]") -> None:
+    global _started
+    _active.remove(profiler)
+    if not _active and _started:
+        tracemalloc.stop()
+        _started = False
+
+
+def _can_reset_peak() -> bool:
+    return _started and hasattr(tracemalloc, "reset_peak")
+
+
+def _reset_peak() -> None:
+    current, peak = tracemalloc.get_traced_memory()
+    for p in _active:
+        p._peak = max(p._peak, peak)
+        if p._before is not None:
+            p._stage_peak = max(p._stage_peak, peak - p._before)
+    tracemalloc.reset_peak()
+
+
+class StageMemory(NamedTuple):
+    samples: int = 0
+    allocated: int = 0
+    peak: int = 0
+
+    @property
+    def bytes_per_element(self) -> float:
+        if self.samples == 0:
+            return 0.0
+        return self.allocated / self.samples
+
+
+class MemoryReport(NamedTuple):
+    elements: int = 0
+    sampled: int = 0
+    peak: int = 0
+    source: StageMemory = StageMemory()
+    cast: StageMemory = StageMemory()
+    on_error: StageMemory = StageMemory()
+
+    @property
+    def bytes_per_element(self) -> float:
+        if self.sampled == 0:
+            return 0.0
+        return (self.source.allocated + self.cast.allocated + self.on_error.allocated) / self.sampled
+
+
+class ProfiledTypedIterator(Generic[T]):
+    def __init__(
+        self,
+        typed_iterable: "GenericTypedIterable[T]",
+        it: Iterable[Any],
+        on_error: Optional[Callable[[Any, int, Exception], None]] = None,
+        sample_every: int = 1,
+    ):
+        if sample_every <= 0:
+            raise ValueError(sample_every)
+        self._elements = 0
+        self._sampled = 0
+        self._peak = 0
+        self._stages: List[List[int]] = [[0, 0, 0], [0, 0, 0], [0, 0, 0]]
+        self._before: Optional[int] = None
+        self._stage_peak = 0
+        self._stage_reset = False
+        self._it = self._iterate(typed_iterable, it, on_error, sample_every)
+
+    def _start_stage(self) -> int:
+        self._stage_peak = 0
+        self._stage_reset = _can_reset_peak()
+        if self._stage_reset:
+            _reset_peak()
+        self._before = tracemalloc.get_traced_memory()[0]
+        return self._before
+
+    def _end_stage(self, stage: int, before: int) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        self._before = None
+        s = self._stages[stage]
+        s[0] += 1
+        s[1] += current - before
+        s[2] = max(s[2], self._stage_peak, (peak if self._stage_reset else current) - before)
+        self._peak = max(self._peak, peak)
+
+    def _iterate(
+        self,
+        typed_iterable: "GenericTypedIterable[T]",
+        it: Iterable[Any],
+        on_error: Optional[Callable[[Any, int, Exception], None]],
+        sample_every: int,
+    ) -> Iterator[T]:
+        _start_tracing(self)
+        try:
+            source = iter(it)
+            cast = typed_iterable._cast
+            i = 0
+            while True:
+                sampled = i % sample_every == 0
+                if sampled:
+                    before = self._start_stage()
+                    d = next(source, _END)
+                    if d is _END:
+                        return
+                    self._end_stage(_SOURCE, before)
+                    self._sampled += 1
+                else:
+                    d = next(source, _END)
+                    if d is _END:
+                        return
+                self._elements += 1
+                try:
+                    if sampled:
+                        before = self._start_stage()
+                        try:
+                            res = cast(d)
+                        finally:
+                            self._end_stage(_CAST, before)
+                    else:
+                        res = cast(d)
+                except Exception as e:
+                    if on_error is None:
+                        raise
+                    if sampled:
+                        before = self._start_stage()
+                        try:
+                            on_error(d, i, e)
+                        finally:
+                            self._end_stage(_ON_ERROR, before)
+                    else:
+                        on_error(d, i, e)
+                else:
+                    yield res
+                i += 1
+        finally:
+            self._peak = max(self._peak, tracemalloc.get_traced_memory()[1])
+            _stop_tracing(self)
+
+    def report(self) -> MemoryReport:
+        return MemoryReport(
+            elements=self._elements,
+            sampled=self._sampled,
+            peak=self._peak,
+            source=StageMemory(*self._stages[_SOURCE]),
+            cast=StageMemory(*self._stages[_CAST]),
+            on_error=StageMemory(*self._stages[_ON_ERROR]),
+        )
+
+    def __iter__(self) -> "ProfiledTypedIterator[T]":
+        return self
+
+    def __next__(self) -> T:
+        return next(self._it)
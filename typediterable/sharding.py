@@ -0,0 +1,151 @@
+import os
+import sys
+
+if sys.version_info < (3, 9):
+    from typing import Callable, Iterable, Iterator
+else:
+    from collections.abc import Callable, Iterable, Iterator
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Generic,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from .core import GenericTypedIterable
+
+T = TypeVar("T")
+
+
+class Segment(NamedTuple):
+    path: str
+    start: int
+    end: int
+
+
+class ShardPosition(NamedTuple):
+    path: str
+    offset: int
+
+
+class ShardStats(NamedTuple):
+    shard_index: int
+    shard_count: int
+    segments: int = 0
+    elements: int = 0
+    failed: int = 0
+    bytes_read: int = 0
+
+
+def plan_segments(sources: Iterable[Union[str, "os.PathLike[str]"]], split_bytes: int) -> List[Segment]:
+    if split_bytes <= 0:
+        raise ValueError(split_bytes)
+    segments = []
+    for source in sources:
+        path = os.fspath(source)
+        size = os.path.getsize(path)
+        for start in range(0, size, split_bytes):
+            segments.append(Segment(path=path, start=start, end=min(start + split_bytes, size)))
+    return segments
+
+
+def shard_segments(segments: List[Segment], shard_index: int, shard_count: int) -> List[Segment]:
+    if shard_count <= 0:
+        raise ValueError(shard_count)
+    if shard_index < 0 or shard_count <= shard_index:
+        raise IndexError(shard_index)
+    return segments[shard_index::shard_count]
+
+
+def _read_lines(segment: Segment) -> Iterator[Tuple[int, bytes]]:
+    with open(segment.path, "rb") as fin:
+        if segment.start > 0:
+            fin.seek(segment.start - 1)
+            fin.readline()
+        pos = fin.tell()
+        while pos < segment.end:
+            line = fin.readline()
+            if not line:
+                return
+            yield pos, line
+            pos += len(line)
+
+
+def _decode_line(line: bytes, encoding: str) -> str:
+    d = line.decode(encoding)
+    if d.endswith("\r\n"):
+        return d[:-2] + "\n"
+    if d.endswith("\r"):
+        return d[:-1] + "\n"
+    return d
+
+
+class ShardedTypedIterator(Generic[T]):
+    def __init__(
+        self,
+        typed_iterable: "GenericTypedIterable[T]",
+        segments: List[Segment],
+        shard_index: int,
+        shard_count: int,
+        on_error: Optional[Callable[[Any, ShardPosition, Exception], None]] = None,
+        parse: Optional[Callable[[str], Any]] = None,
+        encoding: str = "utf-8",
+    ):
+        self._shard_index = shard_index
+        self._shard_count = shard_count
+        self._segments = 0
+        self._elements = 0
+        self._failed = 0
+        self._bytes_read = 0
+        self._it = self._iterate(typed_iterable, segments, on_error, parse, encoding)
+
+    def _iterate(
+        self,
+        typed_iterable: "GenericTypedIterable[T]",
+        segments: List[Segment],
+        on_error: Optional[Callable[[Any, ShardPosition, Exception], None]],
+        parse: Optional[Callable[[str], Any]],
+        encoding: str,
+    ) -> Iterator[T]:
+        cast = typed_iterable._cast
+        for segment in segments:
+            self._segments += 1
+            for pos, line in _read_lines(segment):
+                self._bytes_read += len(line)
+                d: Any = line
+                try:
+                    d = _decode_line(line, encoding)
+                    if parse is not None:
+                        d = parse(d)
+                    res = cast(d)
+                except Exception as e:
+                    if on_error is None:
+                        raise
+                    self._failed += 1
+                    on_error(d, ShardPosition(path=segment.path, offset=pos), e)
+                    continue
+                self._elements += 1
+                yield res
+
+    def stats(self) -> ShardStats:
+        return ShardStats(
+            shard_index=self._shard_index,
+            shard_count=self._shard_count,
+            segments=self._segments,
+            elements=self._elements,
+            failed=self._failed,
+            bytes_read=self._bytes_read,
+        )
+
+    def __iter__(self) -> "ShardedTypedIterator[T]":
+        return self
+
+    def __next__(self) -> T:
+        return next(self._it)